@@ -1,14 +1,21 @@
 #!/usr/bin/env python3
 
 import argparse
-import csv
+import concurrent.futures
 import datetime
+import itertools
+import orjson
 import os
 import re
-import requests
+import requests_cache
 import sys
+import threading
+import time
+import urllib3
+from pathlib import Path
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional, Tuple
 
 # ===================================================
 # CONFIGURATIONS
@@ -17,20 +24,75 @@ from typing import List, Dict, Any, Optional
 PAGERDUTY_API_TOKEN = os.getenv("PAGERDUTY_API_TOKEN")
 PD_BASE_URL = "https://api.pagerduty.com"
 REQUEST_TIMEOUT = 20 # seconds
+TRANSIENT_STATUSES = {429, 500, 502, 503, 504} # rate limits / server hiccups worth waiting out
+MAX_PAGE_ATTEMPTS = 5 # manual waits per page after the adapter's retries are exhausted
+TEAM_CACHE_PATH = Path.home() / ".pd_team_ids.json" # persistent team name -> id mapping
+RESOLVE_FETCH_CONCURRENCY = 16 # worker threads for fallback log_entries fetches, kept under PagerDuty's rate limit
+CSV_CHUNK_SIZE = 200 # incidents held in memory at once while streaming to CSV; also the writerows batch size
 
 PD_API_HEADERS = {
     "Accept": "application/vnd.pagerduty+json;version=2",
+    # Incident JSON compresses 10-20x; urllib3 decompresses transparently
+    # (Brotli support comes from the Brotli package in requirements.txt).
+    "Accept-Encoding": "gzip, deflate, br",
     "Authorization": f"Token token={PAGERDUTY_API_TOKEN}",
 }
 
+# Single keep-alive session shared by every PagerDuty call so the TLS handshake
+# is paid once per run instead of once per request. Responses are cached on
+# disk (SQLite) for an hour so re-runs over overlapping windows only fetch
+# what actually changed.
+SESSION = requests_cache.CachedSession(cache_name=".pd_cache", backend="sqlite", expire_after=3600)
+SESSION.headers.update(PD_API_HEADERS)
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=32,
+        max_retries=urllib3.util.Retry(
+            total=8,
+            backoff_factor=1.0,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            allowed_methods=frozenset(["GET"]),
+            # Hand the final response back instead of raising RetryError so the
+            # pagination loop can wait out bursts that outlast these retries.
+            raise_on_status=False,
+        ),
+    ),
+)
+
 # ===================================================
 # FUNCTIONS
 # ===================================================
 
 PAGERDUTY_TEAM_ID_PATTERN = re.compile(r"^[A-Z0-9]{7,}$")
+FILENAME_SANITIZE_PATTERN = re.compile(r"[^A-Za-z0-9]+")
+
+CACHE_STATS = {"hits": 0, "misses": 0}
+CACHE_STATS_LOCK = threading.Lock() # session_get runs on worker threads too
+
+# Global cap on in-flight API requests. Nested fan-outs (per-chunk fallback
+# threads that each paginate log_entries) must not multiply past this, and
+# pool_maxsize alone doesn't enforce it since HTTPAdapter doesn't block.
+REQUEST_SEMAPHORE = threading.BoundedSemaphore(RESOLVE_FETCH_CONCURRENCY)
+
+def session_get(url: str, **kwargs: Any) -> requests_cache.AnyResponse:
+    """GET through the cached session, counting hits/misses for the end-of-run summary."""
+    with REQUEST_SEMAPHORE:
+        response = SESSION.get(url, **kwargs)
+    with CACHE_STATS_LOCK:
+        if getattr(response, "from_cache", False):
+            CACHE_STATS["hits"] += 1
+        else:
+            CACHE_STATS["misses"] += 1
+    return response
+
+def print_cache_summary() -> None:
+    print(f"[INFO]: Cache: {CACHE_STATS['hits']} hits, {CACHE_STATS['misses']} misses.")
 
 def sanitize_filename_component(name: str) -> str:
-    s = re.sub(r"[^A-Za-z0-9]+", "_", name.strip().lower()).strip("_")
+    s = FILENAME_SANITIZE_PATTERN.sub("_", name.strip().lower()).strip("_")
     return s or "team"
 
 def is_pagerduty_team_id(value: str) -> bool:
@@ -42,12 +104,35 @@ def validate_team_id(team_id: str) -> str:
         sys.exit(1)
     return team_id
 
+def load_team_id_cache() -> Dict[str, str]:
+    """Load the on-disk team name -> id mapping; missing or corrupt files are empty."""
+    try:
+        data = orjson.loads(TEAM_CACHE_PATH.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+def save_team_id_cache(cache: Dict[str, str]) -> None:
+    try:
+        TEAM_CACHE_PATH.write_bytes(orjson.dumps(cache))
+    except OSError:
+        pass # best effort; the next run just re-resolves
+
 def get_team_id_by_name(team_name: str) -> str:
-    """Search PagerDuty for a team by name (case-insensitive exact match)."""
+    """Search PagerDuty for a team by name (case-insensitive exact match).
+
+    Known names are served from ~/.pd_team_ids.json (team ids are effectively
+    immutable), so repeat runs skip the /teams round-trip entirely.
+    """
+    cache = load_team_id_cache()
+    cached_id = cache.get(team_name.lower())
+    if cached_id and is_pagerduty_team_id(cached_id):
+        return cached_id
+
     url = f"{PD_BASE_URL}/teams"
     params = {"query": team_name, "limit": 100}
     try:
-        response = requests.get(url, headers=PD_API_HEADERS, params=params, timeout=REQUEST_TIMEOUT)
+        response = session_get(url, params=params, timeout=REQUEST_TIMEOUT)
         if response.status_code != 200:
             print(f"[ERROR]: Failed to retrieve teams: {response.text}")
             sys.exit(1)
@@ -55,81 +140,96 @@ def get_team_id_by_name(team_name: str) -> str:
         print(f"[ERROR]: Request to PagerDuty failed while fetching teams: {e}")
         sys.exit(1)
 
-    data = response.json() or {}
+    data = (orjson.loads(response.content) if response.content else None) or {}
 
     for team in data.get("teams", []):
         if str(team.get("name", "")).lower() == team_name.lower():
-            return validate_team_id(str(team.get("id") or ""))
+            team_id = validate_team_id(str(team.get("id") or ""))
+            cache[team_name.lower()] = team_id
+            save_team_id_cache(cache)
+            return team_id
     print(f"[ERROR]: Team '{team_name}' not found.")
     sys.exit(1)
 
-def get_incidents_for_team(team_id: str, since: str, until: str) -> List[Dict[str, Any]]:
-    """Fetch incidents for the team between 'since' and 'until'."""
-    incidents: List[Dict[str, Any]] = []
+def iter_day_buckets(since: str, until: str) -> Iterator[Tuple[str, str]]:
+    """Split 'since'..'until' into UTC-day buckets (first/last clamped to the exact bounds).
+
+    Interior buckets are midnight-aligned, so their request URLs are identical
+    across runs and can be served from the on-disk cache.
+    """
+    cursor = datetime.datetime.fromisoformat(since.replace("Z", "+00:00"))
+    end = datetime.datetime.fromisoformat(until.replace("Z", "+00:00"))
+    while cursor < end:
+        next_midnight = (cursor + datetime.timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        bucket_end = min(next_midnight, end)
+        yield to_iso8601_utc(cursor), to_iso8601_utc(bucket_end)
+        cursor = bucket_end
+
+def iter_incidents_for_team(team_id: str, since: str, until: str) -> Iterator[Dict[str, Any]]:
+    """Yield incidents for the team between 'since' and 'until' as pages arrive.
+
+    Streaming keeps memory flat at one page (100 incidents) and lets the CSV
+    writer start as soon as the first page lands instead of after the last.
+    """
     url = f"{PD_BASE_URL}/incidents"
     limit = 100
-    offset = 0
 
     validate_team_id(team_id)
 
-    total_count: Optional[int] = None
-    fetched_count = 0
-    printed_progress = False
-
-    while True:
-        params = {
-            "team_ids[]": [team_id],
-            "since": since,
-            "until": until,
-            "limit": limit,
-            "offset": offset,
-            "total": "true",
-        }
-        try:
-            response = requests.get(url, headers=PD_API_HEADERS, params=params, timeout=REQUEST_TIMEOUT)
-            if response.status_code != 200:
-                print(f"[ERROR]: Failed to retrieve incidents: {response.text}")
-                sys.exit(1)
-        except RequestException as e:
-            print(f"[ERROR]: Request to PagerDuty failed while fetching incidents: {e}")
-            sys.exit(1)
-        data = response.json() or {}
-        page_incidents = data.get("incidents", [])
-        incidents.extend(page_incidents)
-
-        if total_count is None:
+    for bucket_since, bucket_until in iter_day_buckets(since, until):
+        # The final bucket is clamped to 'until' (i.e. "now"), so its contents
+        # keep changing between runs; never cache it.
+        cache_args = {"expire_after": requests_cache.DO_NOT_CACHE} if bucket_until >= until else {}
+        offset = 0
+        attempts = 0
+        while True:
+            params = {
+                "team_ids[]": [team_id],
+                "since": bucket_since,
+                "until": bucket_until,
+                "limit": limit,
+                "offset": offset,
+                # Server-side aggregation: ship each incident's log entries (and the
+                # users/services they reference) with the page instead of N follow-up calls.
+                "include[]": ["log_entries", "users", "services"],
+            }
             try:
-                total_count = int(data.get("total")) if data.get("total") is not None else None
-            except (ValueError, TypeError):
-                total_count = None
-
-        fetched_count += len(page_incidents)
-        if total_count:
-            print_progress_bar("Fetching incidents: ", fetched_count, total_count)
-            printed_progress = True
+                response = session_get(url, params=params, timeout=REQUEST_TIMEOUT, **cache_args)
+                if response.status_code in TRANSIENT_STATUSES:
+                    # The adapter's retries are exhausted; wait out the burst and
+                    # resume this page instead of throwing away completed pages.
+                    attempts += 1
+                    if attempts >= MAX_PAGE_ATTEMPTS:
+                        print(f"[ERROR]: Still getting {response.status_code} after {attempts} waits: {response.text}")
+                        sys.exit(1)
+                    try:
+                        retry_after = int(response.headers.get("Retry-After") or 30)
+                    except ValueError: # header can also be an HTTP-date
+                        retry_after = 30
+                    print(f"[WARN]: Got {response.status_code} from PagerDuty, retrying this page in {retry_after}s...")
+                    time.sleep(retry_after)
+                    continue
+                if response.status_code != 200:
+                    print(f"[ERROR]: Failed to retrieve incidents: {response.text}")
+                    sys.exit(1)
+            except RequestException as e:
+                print(f"[ERROR]: Request to PagerDuty failed while fetching incidents: {e}")
+                sys.exit(1)
+            attempts = 0
+            # orjson decodes the multi-MB incident pages several times faster
+            # than stdlib json -- the dominant CPU cost once pages are cached.
+            data = (orjson.loads(response.content) if response.content else None) or {}
+            page_incidents = data.get("incidents", [])
+            yield from page_incidents
 
-        if not data.get("more", False):
-            break
-        offset += limit
+            if not data.get("more", False):
+                break
+            offset += limit
 
-    if printed_progress:
-        sys.stdout.write("\n")
-    return incidents
 
-
-def get_incident_resolve_metadata(incident_id: str) -> Dict[str, Optional[str]]:
-    """Return resolver and reason from the incident's resolve log entry."""
-    url = f"{PD_BASE_URL}/incidents/{incident_id}/log_entries"
-    params = {"limit": 100, "is_overview": "false", "include[]": "users"}
-    try:
-        response = requests.get(url, headers=PD_API_HEADERS, params=params, timeout=REQUEST_TIMEOUT)
-        if response.status_code != 200:
-            return {"resolved_by": None}
-    except RequestException:
-        return {"resolved_by": None}
-
-    data = response.json() or {}
-    for entry in data.get("log_entries", []):
+def resolve_metadata_from_entries(log_entries: List[Dict[str, Any]]) -> Dict[str, Optional[str]]:
+    """Return resolver and reason from a list of log entries, if a resolve entry is present."""
+    for entry in log_entries:
         if entry.get("type") == "resolve_log_entry":
             agent = entry.get("agent") or {}
             resolved_by = agent.get("summary") or agent.get("name")
@@ -141,8 +241,105 @@ def get_incident_resolve_metadata(incident_id: str) -> Dict[str, Optional[str]]:
     return {"resolved_by": None}
 
 
-def write_incidents_to_csv(incidents: List[Dict[str, Any]], team_name: str, filename: Optional[str] = None) -> None:
-    """Write the incident data to CSV with selected fields."""
+def extract_resolve_metadata(incident: Dict[str, Any]) -> Dict[str, Optional[str]]:
+    """Return resolver and reason from the log entries embedded in the incident."""
+    return resolve_metadata_from_entries(incident.get("log_entries", []) or [])
+
+
+def get_incident_resolve_metadata(incident_id: str) -> Dict[str, Optional[str]]:
+    """Fetch one incident's log entries (all pages) and return its resolve metadata."""
+    url = f"{PD_BASE_URL}/incidents/{incident_id}/log_entries"
+    limit = 100
+
+    def fetch_page(offset: int) -> Dict[str, Any]:
+        params = {"limit": limit, "offset": offset, "total": "true", "is_overview": "false", "include[]": "users"}
+        try:
+            response = session_get(url, params=params, timeout=REQUEST_TIMEOUT)
+            if response.status_code != 200:
+                return {}
+        except RequestException:
+            return {}
+        return (orjson.loads(response.content) if response.content else None) or {}
+
+    first = fetch_page(0)
+    meta = resolve_metadata_from_entries(first.get("log_entries", []))
+    if meta.get("resolved_by") or not first.get("more", False):
+        return meta
+
+    # Long-lived incidents can push the resolve entry past the first page.
+    # The first response carries the total, so fetch the remaining pages
+    # concurrently and stop at the first one holding the resolve entry.
+    try:
+        total = int(first.get("total") or 0)
+    except (ValueError, TypeError):
+        total = 0
+    pages = max(2, -(-total // limit)) # ceil; at least one follow-up page
+    offsets = [limit * page for page in range(1, pages)]
+    # REQUEST_SEMAPHORE caps what actually hits the wire; this pool only sizes
+    # the fan-out for one incident's pages.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(RESOLVE_FETCH_CONCURRENCY, len(offsets))) as executor:
+        futures = [executor.submit(fetch_page, offset) for offset in offsets]
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                meta = resolve_metadata_from_entries(future.result().get("log_entries", []))
+                if meta.get("resolved_by"):
+                    return meta
+        finally:
+            # Short-circuit for real: pages that haven't started are dropped
+            # rather than fetched during the pool's shutdown.
+            for future in futures:
+                future.cancel()
+    return meta
+
+
+def build_resolve_map(incidents: List[Dict[str, Any]]) -> Dict[str, Optional[str]]:
+    """Map resolved incident ids to their resolver.
+
+    Resolve metadata ships with the incidents via include[]=log_entries, so
+    most incidents need no follow-up call. Only resolved incidents whose
+    embedded entries are missing the resolve entry fall back to the concurrent
+    log_entries fetch.
+    """
+    resolve_map: Dict[str, Optional[str]] = {}
+    fallback_ids: List[str] = []
+    for inc in incidents:
+        if inc.get("status") != "resolved":
+            continue
+        inc_id = str(inc.get("id", ""))
+        resolved_by = extract_resolve_metadata(inc).get("resolved_by")
+        if resolved_by:
+            resolve_map[inc_id] = resolved_by
+            continue
+        # When the last status change *is* the resolution, last_status_change_by
+        # is by definition the resolver -- trust it and skip the round-trip.
+        last_changer = (inc.get("last_status_change_by") or {}).get("summary")
+        if last_changer and inc.get("last_status_change_at") and inc.get("last_status_change_at") == inc.get("resolved_at"):
+            resolve_map[inc_id] = str(last_changer)
+        else:
+            fallback_ids.append(inc_id)
+    if fallback_ids:
+        # The shared SESSION is thread-safe across urllib3's connection pool,
+        # so the fallback fetches fan out over worker threads.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=RESOLVE_FETCH_CONCURRENCY) as executor:
+            for inc_id, meta in zip(fallback_ids, executor.map(get_incident_resolve_metadata, fallback_ids)):
+                resolve_map[inc_id] = meta.get("resolved_by")
+    return resolve_map
+
+
+def encode_cell(value: Any) -> str:
+    """Encode one CSV cell per RFC 4180, quoting only when actually needed.
+
+    PagerDuty fields (urls, numbers, ISO timestamps) almost never need
+    escaping, so the hot path is a plain str with no dialect machinery.
+    """
+    s = value if isinstance(value, str) else str(value)
+    if '"' in s or "," in s or "\n" in s or "\r" in s:
+        return '"' + s.replace('"', '""') + '"'
+    return s
+
+
+def write_incidents_to_csv(incidents_iter: Iterator[Dict[str, Any]], team_name: str, filename: Optional[str] = None) -> int:
+    """Stream the incident data to CSV with selected fields; return rows written."""
     if not filename:
         team = sanitize_filename_component(team_name)
         filename = f"pagerduty_incidents_{team}.csv"
@@ -156,64 +353,79 @@ def write_incidents_to_csv(incidents: List[Dict[str, Any]], team_name: str, file
         "Urgency",
         "Resolved By",
     ]
-    with open(filename, mode="w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(headers)
-
-        total_items = len(incidents)
-        processed = 0
-        printed_progress = False
-
-        for inc in incidents:
-            service = inc.get("service") or {}
-            service_name = service.get("summary") or service.get("name") or "N/A"
-
-            resolved_by = ""
-            if inc.get("status") == "resolved":
-                meta = get_incident_resolve_metadata(str(inc.get("id", "")))
-                resolved_by = meta.get("resolved_by") or ((inc.get("last_status_change_by") or {}).get("summary")) or "Unknown"
-
-            writer.writerow([
-                inc.get("html_url", ""),
-                inc.get("incident_number", "N/A"),
-                inc.get("title", "N/A"),
-                inc.get("status", "N/A"),
-                service_name,
-                inc.get("created_at", "N/A"),
-                inc.get("urgency", "N/A"),
-                resolved_by,
-            ])
-
-            processed += 1
-            if total_items:
-                print_progress_bar("Exporting incidents:", processed, total_items)
-                printed_progress = True
+    written = 0
+    printed_progress = False
+    f = None
+
+    try:
+        # Consume one chunk at a time so memory stays at O(CSV_CHUNK_SIZE) and
+        # rows hit the disk while later pages are still being fetched.
+        while True:
+            chunk = list(itertools.islice(incidents_iter, CSV_CHUNK_SIZE))
+            if not chunk:
+                break
+            # Open lazily on the first chunk: an empty window must never
+            # truncate an existing file the user pointed --output at.
+            if f is None:
+                f = open(filename, mode="w", newline="", encoding="utf-8")
+                f.write(",".join(headers) + "\n")
+            resolve_map = build_resolve_map(chunk)
+
+            # Build the whole batch in one comprehension: no per-row append or
+            # intermediate variables, just the unavoidable .get chains (which
+            # keep their defaults for sparse incident payloads).
+            rows = [
+                [
+                    inc.get("html_url", ""),
+                    inc.get("incident_number", "N/A"),
+                    inc.get("title", "N/A"),
+                    inc.get("status", "N/A"),
+                    (service := inc.get("service") or {}).get("summary") or service.get("name") or "N/A",
+                    inc.get("created_at", "N/A"),
+                    inc.get("urgency", "N/A"),
+                    (resolve_map.get(str(inc.get("id", ""))) or (inc.get("last_status_change_by") or {}).get("summary") or "Unknown")
+                    if inc.get("status") == "resolved" else "",
+                ]
+                for inc in chunk
+            ]
+
+            # One write call and one progress update per batch, not per row.
+            f.write("\n".join(",".join(encode_cell(cell) for cell in row) for row in rows) + "\n")
+            written += len(rows)
+            print_progress_bar("Exporting incidents:", written, None)
+            printed_progress = True
+    finally:
+        if f is not None:
+            f.close()
 
     if printed_progress:
         sys.stdout.write("\n")
-    print(f"[INFO] {len(incidents)} incidents exported to {filename}")
+    if written:
+        print(f"[INFO] {written} incidents exported to {filename}")
+    return written
 
 def to_iso8601_utc(dt: datetime.datetime) -> str:
     return dt.replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
+BAR_LENGTH = 30 # Sets the bar length to 30 characters
+# All 31 possible frames, precomputed once so every update is a list lookup
+# plus a single write instead of rebuilding three strings per call.
+BAR_FRAMES = ["█" * i + ("▄" if i < BAR_LENGTH else "") + "▁" * max(0, BAR_LENGTH - i - 1) for i in range(BAR_LENGTH + 1)]
+
 def print_progress_bar(prefix: str, current: int, total: Optional[int]) -> None:
     """Render a simple inline progress bar using ▁ (empty), ▄ (current), █ (completed)."""
-    bar_len = 30 # Sets the bar length to 30 characters
     if total and total > 0: # Check for valid total and if bar should be rendered
-        ratio = 0 if total == 0 else max(0.0, min(1.0, current / total)) # Calculate progress ratio between 0 and 1
-        pos = int(bar_len * ratio) # Use ratio int to determine position within the bar
-        if pos >= bar_len: # Detects completion status based on the bar length
-            bar = "█" * bar_len # Render completed bar if task is done
-        else: # Build the bar to show progress
-            completed = "█" * max(0, pos) # Defines completed indicator.
-            current_block = "▄" # Defines in progress indicator
-            empty = "▁" * max(0, bar_len - pos - 1) # Defines empty/to-do indicator
-            bar = f"{completed}{current_block}{empty}" # Assemble the three-part bar to show progression
+        ratio = max(0.0, min(1.0, current / total)) # Calculate progress ratio between 0 and 1
+        pos = int(BAR_LENGTH * ratio) # Use ratio int to pick the frame position
+        bar = BAR_FRAMES[min(pos, BAR_LENGTH)] # Look up the cached frame for this position
         sys.stdout.write(f"\r{prefix} [{bar}] {current}/{total}") # Render the bar in terminal with numeric status
     else:
         sys.stdout.write(f"\r{prefix} {current}") # Print the current count if no total is provided
-    sys.stdout.flush() # Display progression as soon as possible
+    # Flush sparingly: on completion or roughly every 1% of progress. Per-call
+    # flushes cause thousands of terminal redraws on large exports.
+    if not total or current >= total or current % max(1, total // 100) == 0:
+        sys.stdout.flush()
 
 def parse_arguments() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -224,12 +436,15 @@ def parse_arguments() -> argparse.Namespace:
             "Examples:\n"
             "  pd_team_incident_exporter.py --team <team_name>\n"
             "  pd_team_incident_exporter.py -t <team_name> --days 90 -o <file_name>.csv\n"
+            "  pd_team_incident_exporter.py -t <team_a> -t <team_b>\n"
+            "  pd_team_incident_exporter.py -t <team_a>,<team_b>\n"
         ),
     )
     parser.add_argument(
         "-t", "--team",
-        dest="team_name",
-        help="PagerDuty team name (exact)",
+        dest="team_names",
+        action="append",
+        help="PagerDuty team name (exact); repeat the flag or comma-separate for multiple teams",
     )
     parser.add_argument(
         "-d", "--days",
@@ -239,7 +454,7 @@ def parse_arguments() -> argparse.Namespace:
     )
     parser.add_argument(
         "-o", "--output",
-        help="Output CSV filename (defaults to pagerduty_incidents_<team_name>.csv)",
+        help="Output CSV filename, single team only (defaults to pagerduty_incidents_<team_name>.csv)",
     )
     return parser.parse_args()
 
@@ -254,12 +469,22 @@ def main() -> None:
 
     args = parse_arguments()
 
-    team_name = (args.team_name or input("Enter the PagerDuty team name: ").strip())
-    if not team_name:
+    raw_teams = args.team_names or [input("Enter the PagerDuty team name(s), comma-separated: ").strip()]
+    team_names = [name.strip() for raw in raw_teams for name in raw.split(",") if name.strip()]
+    if not team_names:
         print("[ERROR]: Team name cannot be empty.")
         sys.exit(1)
+    if args.output and len(team_names) > 1:
+        print("[ERROR]: --output only applies to a single team; multiple teams get per-team filenames.")
+        sys.exit(1)
 
-    team_id = team_name if is_pagerduty_team_id(team_name) else get_team_id_by_name(team_name)
+    # Resolve every name up front (concurrently when there are several); the
+    # lookups and all exports below share the one pooled session and cache.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=RESOLVE_FETCH_CONCURRENCY) as executor:
+        team_ids = list(executor.map(
+            lambda name: name if is_pagerduty_team_id(name) else get_team_id_by_name(name),
+            team_names,
+        ))
 
     now_utc = datetime.datetime.now(datetime.timezone.utc)
     lookback_days = max(1, int(args.days))
@@ -268,15 +493,17 @@ def main() -> None:
     since = to_iso8601_utc(lookback_utc)
     until = to_iso8601_utc(now_utc)
 
-    # Displays the date range (start and end, formatted as YYYY-MM-DD)
-    print(f"[INFO]: Fetching incidents for team '{team_name}' from {since[:10]} to {until[:10]} (last {lookback_days} days)...")
+    for team_name, team_id in zip(team_names, team_ids):
+        # Displays the date range (start and end, formatted as YYYY-MM-DD)
+        print(f"[INFO]: Fetching incidents for team '{team_name}' from {since[:10]} to {until[:10]} (last {lookback_days} days)...")
 
-    incidents = get_incidents_for_team(team_id, since, until)
+        incidents_iter = iter_incidents_for_team(team_id, since, until)
 
-    if incidents:
-        write_incidents_to_csv(incidents, team_name, args.output)
-    else:
-        print(f"[INFO]: No incidents found for team '{team_name}' in the last {lookback_days} days.")
+        exported = write_incidents_to_csv(incidents_iter, team_name, args.output)
+        if not exported:
+            print(f"[INFO]: No incidents found for team '{team_name}' in the last {lookback_days} days.")
+
+    print_cache_summary()
 
 if __name__ == "__main__":
     main()